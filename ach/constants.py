@@ -62,7 +62,7 @@ class TransactionCode(enum.IntEnum):
 
     def is_prenote(self) -> bool:
         """Return True if TransactionCode is only a dry-run transaction (prenote), else False"""
-        return self.value % 10 in [3, 8]
+        return self.value % 10 in (3, 8)
 
     def is_checking(self) -> bool:
         """Return True if transaction is against a checking account, else False"""
@@ -121,6 +121,7 @@ class AutoDateInput(enum.Enum):
 
 
 RECORD_SIZE = 94
+PADDING_LINE = "9" * RECORD_SIZE
 
 FILE_HEADER_RECORD_TYPE_CODE = 1
 FILE_HEADER_PRIORITY_CODE = 1
@@ -1,5 +1,9 @@
 """Defines file structure along with ways to translate to and from a flat ACH file."""
 
 from .file_builder import ACHFileBuilder, NoBatchForTransactionError
-from .file_parser import ACHFileContentsParser
+from .file_parser import (
+    ACHFileContentsParser,
+    RecordOutOfOrderError,
+    UnknownRecordTypeCodeError,
+)
 from .file_structure import ACHFileContents, ACHBatch, ACHTransactionEntry
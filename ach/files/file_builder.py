@@ -1,6 +1,6 @@
 """Defines an ACH file builder."""
 
-from typing import Any, Dict, List, Tuple
+from typing import IO, Any, Dict, List, Optional, Tuple
 
 from ..record_types import (
     AddendaRecordType,
@@ -30,10 +30,15 @@ class ACHFileBuilder:
     entry_detail_record_type_class = EntryDetailRecordType
     addenda_record_type_class = AddendaRecordType
 
-    def __init__(self, **file_settings):
+    def __init__(
+        self, *, ach_file_contents: Optional[ACHFileContents] = None, **file_settings
+    ):
         """
         Accepts a dict of file settings.
         Run cls.get_file_setting_fields to see all key options.
+        If ach_file_contents is given, wraps it instead of creating a new one
+        from file settings; see from_file_contents.
+        Raises TypeError if both ach_file_contents and file settings are given.
 
         Examples:
 
@@ -53,12 +58,38 @@ class ACHFileBuilder:
                 origin_name='YOUR FINANCIAL INSTITUTION',
             )
         """
-        self.ach_file_contents: ACHFileContents = self.ach_file_contents_class(
-            self.file_header_record_type_class(**file_settings)
-        )
-        self.default_odfi_identification: str = file_settings.get(
-            "origin_routing", ""
-        ).lstrip()[:8]
+        if ach_file_contents is None:
+            ach_file_contents = self.ach_file_contents_class(
+                self.file_header_record_type_class(**file_settings)
+            )
+            origin_routing = file_settings.get("origin_routing", "")
+        elif file_settings:
+            raise TypeError(
+                "{} received file settings along with ach_file_contents: {}".format(
+                    type(self).__name__, sorted(file_settings)
+                )
+            )
+        else:
+            origin_routing = ach_file_contents.file_header_record.get_field_value(
+                "origin_routing"
+            )
+        self.ach_file_contents: ACHFileContents = ach_file_contents
+        self.default_odfi_identification: str = origin_routing.lstrip()[:8]
+
+    @classmethod
+    def from_file_contents(cls, ach_file_contents: ACHFileContents) -> "ACHFileBuilder":
+        """
+        Wraps an existing ACHFileContents (such as parser output)
+        without re-creating its records, so batches and entries can be
+        added to it or it can be rendered directly.
+
+        Example:
+            parser = ACHFileContentsParser(ach_file_str)
+            b = ACHFileBuilder.from_file_contents(
+                parser.process_ach_file_contents()
+            )
+        """
+        return cls(ach_file_contents=ach_file_contents)
 
     def render(self, line_break: str = "\n", end: str = "\n") -> str:
         """Renders ACH flat file contents as a string."""
@@ -66,6 +97,15 @@ class ACHFileBuilder:
             line_break=line_break, end=end
         )
 
+    def write(self, file_obj: IO[str], line_break: str = "\n", end: str = "\n") -> int:
+        """
+        Writes ACH flat file contents to a text file object in one call.
+        Returns the number of characters written.
+        """
+        return self.ach_file_contents.write_file_contents(
+            file_obj, line_break=line_break, end=end
+        )
+
     def add_batch(self, **batch_settings: Dict[str, Any]) -> "ACHFileBuilder":
         """
         Accepts a dict of batch settings.
@@ -205,8 +245,7 @@ class ACHFileBuilder:
         update_entry = {
             "addenda_record_indicator": len(raw_addendas),
             "trace_odfi_identifier": self.default_odfi_identification,
-            "trace_sequence_number": len(self.ach_file_contents.get_all_transactions())
-            + 1,
+            "trace_sequence_number": self.ach_file_contents.get_transaction_count() + 1,
         }
         for k, val in update_entry.items():
             if k not in entry_details:
@@ -249,9 +288,7 @@ class ACHFileBuilder:
         If only_required, returns only keywords that need to be set.
         """
         if only_required:
-            required_kwargs = dict(
-                cls.batch_header_record_type_class.get_required_kwargs()
-            )
+            required_kwargs = cls.batch_header_record_type_class.get_required_kwargs()
             required_kwargs.pop("odfi_identification")
             required_kwargs.pop("batch_number")
             return required_kwargs
@@ -266,9 +303,7 @@ class ACHFileBuilder:
         If only_required, returns only keywords that need to be set.
         """
         if only_required:
-            required_kwargs = dict(
-                cls.entry_detail_record_type_class.get_required_kwargs()
-            )
+            required_kwargs = cls.entry_detail_record_type_class.get_required_kwargs()
             required_kwargs.pop("trace_odfi_identifier")
             required_kwargs.pop("trace_sequence_number")
             return required_kwargs
@@ -283,7 +318,7 @@ class ACHFileBuilder:
         If only_required, returns only keywords that need to be set.
         """
         if only_required:
-            required_kwargs = dict(cls.addenda_record_type_class.get_required_kwargs())
+            required_kwargs = cls.addenda_record_type_class.get_required_kwargs()
             required_kwargs.pop("entry_detail_sequence_number")
             return required_kwargs
         return cls.addenda_record_type_class.field_definition_dict
@@ -1,6 +1,7 @@
 """Defines an ACH file parser."""
 
-from typing import Dict, List, Optional, Union
+import io
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Type, Union
 
 from .file_structure import ACHBatch, ACHFileContents, ACHTransactionEntry
 from ..record_types import (
@@ -19,31 +20,133 @@ from ..constants import (
     ENTRY_DETAIL_RECORD_TYPE_CODE,
     FILE_CONTROL_RECORD_TYPE_CODE,
     FILE_HEADER_RECORD_TYPE_CODE,
-    RECORD_SIZE,
+    PADDING_LINE,
 )
 
+_FILE_HEADER_CODE = str(FILE_HEADER_RECORD_TYPE_CODE)
+_BATCH_HEADER_CODE = str(BATCH_HEADER_RECORD_TYPE_CODE)
+_ADDENDA_CODE = str(ADDENDA_RECORD_TYPE_CODE)
+_BATCH_CONTROL_CODE = str(BATCH_CONTROL_RECORD_TYPE_CODE)
+_FILE_CONTROL_CODE = str(FILE_CONTROL_RECORD_TYPE_CODE)
+
+_RECORD_TYPES_BY_CODE = {
+    ADDENDA_RECORD_TYPE_CODE: AddendaRecordType,
+    BATCH_CONTROL_RECORD_TYPE_CODE: BatchControlRecordType,
+    BATCH_HEADER_RECORD_TYPE_CODE: BatchHeaderRecordType,
+    ENTRY_DETAIL_RECORD_TYPE_CODE: EntryDetailRecordType,
+    FILE_CONTROL_RECORD_TYPE_CODE: FileControlRecordType,
+    FILE_HEADER_RECORD_TYPE_CODE: FileHeaderRecordType,
+}
+# Keyed by the leading character of a record line.
+_RECORD_TYPES_BY_LINE_CODE = {str(x): y for x, y in _RECORD_TYPES_BY_CODE.items()}
+
+
+class UnknownRecordTypeCodeError(ValueError):
+    """Raise when a record line starts with an unknown record type code."""
+
+
+class RecordOutOfOrderError(ValueError):
+    """Raise when a record comes before the record it belongs under."""
+
+    msg_format = "{} record found before its {} record: {!r}"
+
+    def __init__(self, record: RecordType, expected_record_name: str):
+        self.record = record
+        self.message = self.msg_format.format(
+            type(record).__name__, expected_record_name, record.render_record_line()
+        )
+        super().__init__(self.message)
+
+
+def _check_preceding_record(
+    record: RecordType, preceding_record: Any, preceding_record_name: str
+) -> None:
+    """Raises RecordOutOfOrderError if the record it belongs under is missing."""
+    if preceding_record is None:
+        raise RecordOutOfOrderError(record, preceding_record_name)
+
 
 class ACHFileContentsParser:
     """
-    Accepts a raw ACH file as a string.
+    Accepts a raw ACH file as a string or bytes, a text or binary file object,
+    or any iterable of str or bytes record lines.
     Can return a list of RecordType types
     and an ACHFileContents type.
+
+    Bytes are decoded with the class encoding (ACH files are ASCII):
+    a bytes buffer all at once, bytes lines (as from a binary file object)
+    one at a time.
+    File objects and other iterables are read lazily, one line at a time,
+    and can only be consumed once.
+    If retain_records, every record yielded is also appended to records_list.
     """
 
-    def __init__(self, ach_file_str: str):
-        self._raw_str = ach_file_str
+    encoding: str = "ascii"
+
+    def __init__(
+        self,
+        ach_file_str: Union[
+            str, bytes, IO[str], IO[bytes], Iterable[Union[str, bytes]]
+        ],
+        retain_records: bool = False,
+    ):
+        self._source = ach_file_str
+        self.retain_records = retain_records
+        self.records_list: List[RecordType] = []
+
+    def iter_records(self) -> Iterator[RecordType]:
+        """Yields RecordTypes one at a time, in order, from the raw ACH file."""
+        for line in self._iter_lines():
+            record = self.convert_line_to_record(line)
+            if record is None:
+                continue
+            if self.retain_records:
+                self.records_list.append(record)
+            yield record
+
+    def _iter_lines(self) -> Iterator[str]:
+        lines = self._source
+        if isinstance(lines, (bytes, bytearray, memoryview)):
+            lines = bytes(lines).decode(self.encoding)
+        if isinstance(lines, str):
+            lines = io.StringIO(lines)
+        for line in lines:
+            if isinstance(line, bytes):
+                line = line.decode(self.encoding)
+            yield line.rstrip("\r\n")
+
+    def iter_line_field_values(self, *field_names: str) -> Iterator[Dict[str, str]]:
+        """
+        Yields raw field values for each record line without creating records,
+        limited to field_names the line's record type has, if any are given.
+        Values are not validated; see RecordType.read_line_field_values.
+        """
+        for line in self._iter_lines():
+            if not line or line == PADDING_LINE:
+                continue
+            record_type_class = self.get_record_type_from_line(line)
+            names = [
+                x for x in field_names if x in record_type_class.field_definition_dict
+            ]
+            if field_names and not names:
+                yield {}
+            else:
+                yield record_type_class.read_line_field_values(line, *names)
 
     def process_records_list(self) -> List[RecordType]:
-        """Processes raw ACH file string into a list of RecordTypes in order."""
-        return self.convert_file_string_to_records_list(self._raw_str)
+        """Processes raw ACH file into a list of RecordTypes in order."""
+        return list(self.iter_records())
 
     def process_ach_file_contents(
         self,
         records_list: Optional[List[RecordType]] = None,
     ) -> ACHFileContents:
-        """Processes a list of RecordTypes into an ACHFileContents."""
-        return self.convert_records_list_to_ach_file_contents(
-            records_list or self.process_records_list()
+        """
+        Processes a list of RecordTypes into an ACHFileContents.
+        If no list is given, streams records from the raw ACH file instead.
+        """
+        return self.convert_records_to_ach_file_contents(
+            records_list or self.iter_records()
         )
 
     @staticmethod
@@ -52,70 +155,50 @@ class ACHFileContentsParser:
         recalc_control_records: bool = False,
     ) -> ACHFileContents:
         """Converts list of RecordTypes to ACHFileContents type."""
-        ach_file_contents = ACHFileContents(
-            records_list[0],
-            ACHFileContentsParser._convert_sub_records_list_to_ach_batch_list(
-                records_list[1:-1],
-                recalc_control_records,
-            ),
+        return ACHFileContentsParser.convert_records_to_ach_file_contents(
+            records_list, recalc_control_records
         )
-        if not recalc_control_records:
-            ach_file_contents.file_control_record = records_list[-1]
-        return ach_file_contents
 
     @staticmethod
-    def _convert_sub_records_list_to_ach_batch_list(
-        records_list: List[RecordType],
-        recalc_batch_control: bool = False,
-    ) -> List[ACHBatch]:
-        ach_batch_list: List[ACHBatch] = []
-        batch_to_records: Dict[
-            BatchControlRecordType,
-            List[Union[EntryDetailRecordType, AddendaRecordType]],
-        ] = {}
-        curr_batch_header: Optional[BatchHeaderRecordType] = None
-        for record in records_list:
-            if record.get_field_value("record_type_code") == str(
-                BATCH_HEADER_RECORD_TYPE_CODE
-            ):
-                curr_batch_header = record
-                batch_to_records[curr_batch_header] = []
-                continue
-            if record.get_field_value("record_type_code") == str(
-                BATCH_CONTROL_RECORD_TYPE_CODE
-            ):
-                # pylint: disable=line-too-long
-                tx_entries = ACHFileContentsParser._convert_batch_transaction_record_types_to_ach_transaction_entry_list(
-                    batch_to_records[curr_batch_header]
-                )
-                ach_batch = ACHBatch(curr_batch_header, tx_entries)
-                if not recalc_batch_control:
-                    ach_batch.batch_control_record = record
-                ach_batch_list.append(ach_batch)
-                continue
-            batch_to_records[curr_batch_header].append(record)
-        return ach_batch_list
-
-    @staticmethod
-    def _convert_batch_transaction_record_types_to_ach_transaction_entry_list(
-        records_list: List[Union[EntryDetailRecordType, AddendaRecordType]],
-    ) -> List[ACHTransactionEntry]:
-        entries: List[ACHTransactionEntry] = []
-        curr_entry: Optional[EntryDetailRecordType] = None
-        curr_entry_addendas: List[AddendaRecordType] = []
-        for record in records_list:
-            if record.get_field_value("record_type_code") == str(
-                ADDENDA_RECORD_TYPE_CODE
-            ):
-                curr_entry_addendas.append(record)
-                continue
-            if curr_entry:
-                entries.append(ACHTransactionEntry(curr_entry, curr_entry_addendas))
-            curr_entry = record
-            curr_entry_addendas = []
-
-        entries.append(ACHTransactionEntry(curr_entry, curr_entry_addendas))
-        return entries
+    def convert_records_to_ach_file_contents(
+        records: Iterable[RecordType],
+        recalc_control_records: bool = False,
+    ) -> ACHFileContents:
+        """
+        Converts RecordTypes to ACHFileContents type in a single pass,
+        so records can be streamed in without first collecting them in a list.
+        Raises RecordOutOfOrderError if a record comes before the file header,
+        batch header or entry detail record it belongs under.
+        """
+        ach_file_contents: Optional[ACHFileContents] = None
+        curr_batch: Optional[ACHBatch] = None
+        curr_entry: Optional[ACHTransactionEntry] = None
+        for record in records:
+            record_type_code = record.get_field_value("record_type_code")
+            if record_type_code == _FILE_HEADER_CODE:
+                ach_file_contents = ACHFileContents(record)
+            elif ach_file_contents is None:
+                raise RecordOutOfOrderError(record, "file header")
+            elif record_type_code == _BATCH_HEADER_CODE:
+                curr_batch = ACHBatch(record)
+                curr_entry = None
+            elif record_type_code == _ADDENDA_CODE:
+                _check_preceding_record(record, curr_entry, "entry detail")
+                curr_entry.add_addenda(record)
+            elif record_type_code == _BATCH_CONTROL_CODE:
+                _check_preceding_record(record, curr_batch, "batch header")
+                if not recalc_control_records:
+                    curr_batch.batch_control_record = record
+                ach_file_contents.add_batch(curr_batch)
+                curr_batch, curr_entry = None, None
+            elif record_type_code == _FILE_CONTROL_CODE:
+                if not recalc_control_records:
+                    ach_file_contents.file_control_record = record
+            else:
+                _check_preceding_record(record, curr_batch, "batch header")
+                curr_entry = ACHTransactionEntry(record)
+                curr_batch.add_transaction(curr_entry)
+        return ach_file_contents
 
     def get_record_fields_dict_list(
         self, records_list: List[RecordType]
@@ -125,41 +208,54 @@ class ACHFileContentsParser:
         """
         dict_list = []
         for record in records_list:
-            dict_list.append({x: y.value for x, y in record.fields.items()})
+            dict_list.append(record.get_field_values())
         return dict_list
 
     @staticmethod
     def get_record_type_from_record_type_code(
         record_type_code: Union[str, int],
-    ) -> Optional[RecordType]:
+    ) -> Optional[Type[RecordType]]:
         """
         Given an integer or single character string,
         returns an associated RecordType Type or None.
         """
-        record_type_map = {
-            ADDENDA_RECORD_TYPE_CODE: AddendaRecordType,
-            BATCH_CONTROL_RECORD_TYPE_CODE: BatchControlRecordType,
-            BATCH_HEADER_RECORD_TYPE_CODE: BatchHeaderRecordType,
-            ENTRY_DETAIL_RECORD_TYPE_CODE: EntryDetailRecordType,
-            FILE_CONTROL_RECORD_TYPE_CODE: FileControlRecordType,
-            FILE_HEADER_RECORD_TYPE_CODE: FileHeaderRecordType,
-        }
-        return record_type_map.get(int(record_type_code))
+        return _RECORD_TYPES_BY_CODE.get(int(record_type_code))
 
     @staticmethod
     def convert_line_to_record_type(
-        line_str: str, record_type_class: RecordType
+        line_str: str, record_type_class: Type[RecordType]
     ) -> RecordType:
         """
         Converts a line in an ACH record to a RecordType according to its
         leading record type code.
         """
-        str_index = 0
-        kwargs = {}
-        for key, field_def in record_type_class.field_definition_dict.items():
-            kwargs[key] = line_str[str_index : str_index + field_def.length]
-            str_index += field_def.length
-        return record_type_class(**kwargs)
+        return record_type_class.from_line(line_str)
+
+    @staticmethod
+    def convert_line_to_record(line_str: str) -> Optional[RecordType]:
+        """
+        Converts a single line of an ACH file to a RecordType.
+        Returns None for empty lines and block padding lines.
+        Raises UnknownRecordTypeCodeError if the line's record type is unknown.
+        """
+        if not line_str or line_str == PADDING_LINE:
+            return None
+        return ACHFileContentsParser.get_record_type_from_line(line_str).from_line(
+            line_str
+        )
+
+    @staticmethod
+    def get_record_type_from_line(line_str: str) -> Type[RecordType]:
+        """
+        Returns the RecordType Type of a record line from its leading character.
+        Raises UnknownRecordTypeCodeError if the character is not a known code.
+        """
+        try:
+            return _RECORD_TYPES_BY_LINE_CODE[line_str[0]]
+        except (KeyError, IndexError) as exc:
+            raise UnknownRecordTypeCodeError(
+                "Unknown record type code in line: {!r}".format(line_str[:1])
+            ) from exc
 
     @staticmethod
     def convert_file_string_to_records_list(
@@ -171,16 +267,9 @@ class ACHFileContentsParser:
         and initializes each line as a RecordType.
         Returns list of RecordTypes.
         """
-        lines = file_str.split(line_break)
         records = []
-        for line in lines:
-            if not line or line == "9" * RECORD_SIZE:
-                continue
-            record_type_class = (
-                ACHFileContentsParser.get_record_type_from_record_type_code(line[0])
-            )
-            record_type = ACHFileContentsParser.convert_line_to_record_type(
-                line, record_type_class
-            )
-            records.append(record_type)
+        for line in file_str.split(line_break):
+            record = ACHFileContentsParser.convert_line_to_record(line)
+            if record is not None:
+                records.append(record)
         return records
@@ -1,9 +1,8 @@
 """Defines ACH file structure and how record types relate."""
 
-from math import ceil
-from typing import Any, Dict, List, Optional, Tuple
+from typing import IO, Any, Dict, Iterable, List, Optional, Tuple
 
-from ..constants import FILE_HEADER_BLOCKING_FACTOR, RECORD_SIZE, TransactionCode
+from ..constants import FILE_HEADER_BLOCKING_FACTOR, PADDING_LINE, TransactionCode
 from ..record_types import (
     AddendaRecordType,
     BatchControlRecordType,
@@ -24,6 +23,13 @@ class ACHFileContents:
         [computed property] file_control_record: FileControlRecordType
     """
 
+    __slots__ = (
+        "_file_header_record",
+        "batches",
+        "_file_control_record",
+        "_recalc_file_control",
+    )
+
     def __init__(
         self,
         file_header_record: FileHeaderRecordType,
@@ -47,14 +53,18 @@ class ACHFileContents:
         Render all records in ACHFileContents as a single flat-file string.
         """
         rendered_line_list = self.get_rendered_line_list()
-        file_contents = line_break.join(rendered_line_list)
-
-        block_orphan_count = len(rendered_line_list) % FILE_HEADER_BLOCKING_FACTOR
-        if block_orphan_count:
-            for _ in range(FILE_HEADER_BLOCKING_FACTOR - block_orphan_count):
-                file_contents += line_break + ("9" * RECORD_SIZE)
+        padding_count = -len(rendered_line_list) % FILE_HEADER_BLOCKING_FACTOR
+        rendered_line_list.extend([PADDING_LINE] * padding_count)
+        return line_break.join(rendered_line_list) + end
 
-        return file_contents + end
+    def write_file_contents(
+        self, file_obj: IO[str], line_break: str = "\n", end: str = "\n"
+    ) -> int:
+        """
+        Write all records as a flat file to a text file object
+        in a single write call. Returns the number of characters written.
+        """
+        return file_obj.write(self.render_file_contents(line_break=line_break, end=end))
 
     def render_json_dict(self) -> Dict[str, Any]:
         """
@@ -110,6 +120,13 @@ class ACHFileContents:
             txs.extend(batch.transactions)
         return txs
 
+    def get_transaction_count(self) -> int:
+        """
+        Count ACHTransactionEntry objects across all batches
+        without collecting them.
+        """
+        return sum(len(batch.transactions) for batch in self.batches)
+
     @property
     def file_control_record(self) -> FileControlRecordType:
         """
@@ -165,10 +182,10 @@ class ACHFileContents:
     ) -> int:
         if line_count is None:
             line_count = self._compute_line_count(entry_addenda_count)
-        return ceil(
-            line_count
-            / float(self.file_header_record.get_field_value("blocking_factor"))
+        blocking_factor = int(
+            self.file_header_record.get_field_value("blocking_factor")
         )
+        return (line_count + blocking_factor - 1) // blocking_factor
 
     def _compute_debit_and_credit_totals(self) -> Tuple[int, int]:
         debit_sum, credit_sum = 0, 0
@@ -193,6 +210,13 @@ class ACHBatch:
         [computed + cached property] batch_control_record: BatchControlRecordType
     """
 
+    __slots__ = (
+        "_batch_header_record",
+        "transactions",
+        "_batch_control_record",
+        "_recalc_batch_control",
+    )
+
     def __init__(
         self,
         batch_header_record: BatchHeaderRecordType,
@@ -227,6 +251,15 @@ class ACHBatch:
         if self._batch_control_record:
             self._recalc_batch_control = True
 
+    def add_transactions(self, transactions: Iterable["ACHTransactionEntry"]) -> None:
+        """
+        Adds several ACHTransactionEntry objects to this ACHBatch at once.
+        If batch control has been computed, set to recalculate.
+        """
+        self.transactions.extend(transactions)
+        if self._batch_control_record:
+            self._recalc_batch_control = True
+
     def remove_transaction_by_index(self, index: int) -> "ACHTransactionEntry":
         """
         Removes an ACHTransactionEntry by index.
@@ -276,10 +309,10 @@ class ACHBatch:
         return batch_dict
 
     def _compute_batch_control_record(self) -> BatchControlRecordType:
-        debit_total, credit_total = self._compute_debit_and_credit_totals()
+        entry_hash, debit_total, credit_total = self._compute_transaction_totals()
         return BatchControlRecordType(
             entry_and_addenda_count=self._compute_entry_and_addenda_count(),
-            entry_hash=self._compute_entry_hash(),
+            entry_hash=entry_hash,
             total_debit_amount=debit_total,
             total_credit_amount=credit_total,
             service_class_code=self._batch_header_record.get_field_value(
@@ -301,10 +334,19 @@ class ACHBatch:
         return sum(x.get_entry_and_addenda_count() for x in self.transactions)
 
     def _compute_debit_and_credit_totals(self) -> Tuple[int, int]:
-        debit_total = sum(x.get_debit_amount() for x in self.transactions)
-        credit_total = sum(x.get_credit_amount() for x in self.transactions)
+        _, debit_total, credit_total = self._compute_transaction_totals()
         return debit_total, credit_total
 
+    def _compute_transaction_totals(self) -> Tuple[int, int, int]:
+        """Return entry hash, debit and credit totals in one pass over transactions."""
+        entry_hash, debit_total, credit_total = 0, 0, 0
+        for transaction in self.transactions:
+            debit_amount, credit_amount = transaction.get_debit_and_credit_amounts()
+            entry_hash += transaction.get_entry_hash_int()
+            debit_total += debit_amount
+            credit_total += credit_amount
+        return entry_hash, debit_total, credit_total
+
 
 class ACHTransactionEntry:
     """
@@ -315,6 +357,8 @@ class ACHTransactionEntry:
         addendas: List[AddendaRecordType]
     """
 
+    __slots__ = ("_entry", "addendas")
+
     def __init__(
         self,
         entry: EntryDetailRecordType,
@@ -364,6 +408,15 @@ class ACHTransactionEntry:
         """Get amount if amount is a credit else 0."""
         return self.get_amount() if self.get_transaction_code_enum().is_credit() else 0
 
+    def get_debit_and_credit_amounts(self) -> Tuple[int, int]:
+        """
+        Get (debit amount, credit amount), one of which is 0,
+        parsing the amount and transaction code only once.
+        """
+        if self.get_transaction_code_enum().is_debit():
+            return self.get_amount(), 0
+        return 0, self.get_amount()
+
     def get_rendered_line_list(self) -> List[str]:
         """
         Get list of all contained RecordTypes rendered
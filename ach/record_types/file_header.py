@@ -67,7 +67,7 @@ class FileHeaderRecordType(RecordType):
             length=1,
             default=FILE_HEADER_DEFAULT_FILE_ID_MODIFIER,
         ),
-        "record size": FieldDefinition(
+        "record_size": FieldDefinition(
             "Record Size", IntegerFieldType, length=3, default=RECORD_SIZE
         ),
         "blocking_factor": FieldDefinition(
@@ -4,12 +4,62 @@ Fields and FieldType classes.
 
 import datetime
 import re
+import sys
+import time
 from contextlib import suppress
 from enum import Enum
-from typing import Optional, Union
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple, Union
 
 from ..constants import AutoDateInput
 
+_ALPHANUM_INVALID_CHARACTERS_REGEX = re.compile(r"[^A-Za-z0-9./()&\'\s-]")
+
+_NOW_FORMAT_CACHE: Dict[Tuple[str, int, int], str] = {}
+
+# Bumped on any public attribute assignment on any FieldDefinition.
+_DEFINITIONS_VERSION = 0
+
+
+def get_definitions_version() -> int:
+    """
+    Returns a number that changes whenever any FieldDefinition is created or
+    changed, so values derived from FieldDefinitions can tell if they are stale.
+    """
+    return _DEFINITIONS_VERSION
+
+
+def _format_now(date_format: str, days: int = 0) -> str:
+    """
+    Formats the current local date and time, shifted by days,
+    reusing the result for calls made within the same second.
+    """
+    key = (date_format, days, int(time.time()))
+    formatted = _NOW_FORMAT_CACHE.get(key)
+    if formatted is None:
+        if len(_NOW_FORMAT_CACHE) >= 16:
+            _NOW_FORMAT_CACHE.clear()
+        formatted = (datetime.datetime.now() + datetime.timedelta(days=days)).strftime(
+            date_format
+        )
+        _NOW_FORMAT_CACHE[key] = formatted
+    return formatted
+
+
+@lru_cache(maxsize=64)
+def _format_iso_datetime(input_string: str, date_format: str) -> Optional[str]:
+    """
+    Reformats an ISO date or datetime string with date_format.
+    Returns None if input is not ISO formatted.
+    """
+    with suppress(ValueError):
+        return datetime.datetime.fromisoformat(input_string).strftime(date_format)
+
+    with suppress(ValueError):
+        return datetime.date.fromisoformat(input_string).strftime(date_format)
+
+    return None
+
 
 class ValueMismatchesFieldTypeError(Exception):
     """
@@ -63,11 +113,9 @@ class Alignment(Enum):
         Aligns text to the left or right of a given string length,
         using padding to fill any gaps if input string is shorter than length.
         """
-        justify_method = {
-            Alignment.LEFT: str.ljust,
-            Alignment.RIGHT: str.rjust,
-        }.get(self)
-        return justify_method(input_string, length, padding)
+        if self is Alignment.LEFT:
+            return input_string.ljust(length, padding)
+        return input_string.rjust(length, padding)
 
     def truncate(self, input_string: str, length: int) -> str:
         """
@@ -75,7 +123,7 @@ class Alignment(Enum):
         If left-aligned, truncates right side; if right-aligned,
         truncates left side.
         """
-        if self == Alignment.LEFT:
+        if self is Alignment.LEFT:
             return input_string[:length]
         return input_string[-length:]
 
@@ -90,18 +138,63 @@ class FieldType:
             either left or right in fixed-width string
         regex: Optional[re.Pattern] -- pattern against which original string
             should be validated
+        time_dependent: bool -- whether corrected input can depend on the
+            current date or time, so cleaned defaults must not be reused
+        line_character_class: Optional[str] -- regex character class such that
+            any fixed-width value made only of its characters is valid and left
+            unchanged by correct_input; lets RecordTypes check whole record lines
+            at once. Not inherited: subclasses that do not set it get None.
     """
 
     padding: str
     alignment: Alignment
     regex: Optional[re.Pattern]
     auto_correct: bool
+    time_dependent: bool = False
+    line_character_class: Optional[str] = None
+    _regex_only_validation: bool = True
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "line_character_class" not in cls.__dict__:
+            cls.line_character_class = None
+        # Validation that is just the regex check can answer is_valid without
+        # building and catching a ValueMismatchesFieldTypeError.
+        cls._regex_only_validation = (
+            cls.do_validation.__func__ is FieldType.do_validation.__func__
+        )
 
     @classmethod
     def apply_fixed_length(cls, input_string: str, length: int) -> str:
         """Adds padding for short strings and truncates long ones."""
-        input_string = cls.alignment.align(input_string, length, cls.padding)
-        return cls.alignment.truncate(input_string, length)
+        missing = length - len(input_string)
+        if missing > 0:
+            if cls.alignment is Alignment.LEFT:
+                input_string = input_string.ljust(length, cls.padding)
+            else:
+                input_string = input_string.rjust(length, cls.padding)
+        elif missing < 0:
+            if cls.alignment is Alignment.LEFT:
+                input_string = input_string[:length]
+            else:
+                input_string = input_string[-length:]
+        return cls.intern_if_padding(input_string)
+
+    @classmethod
+    def intern_if_padding(cls, input_string: str) -> str:
+        """
+        Returns a shared (interned) copy of strings made only of padding,
+        like blank optional fields, so records do not each hold their own.
+        """
+        # Checking the ends first avoids stripping values that are not blank.
+        if (
+            not input_string
+            or input_string[0] != cls.padding
+            or input_string[-1] != cls.padding
+            or input_string.strip(cls.padding)
+        ):
+            return input_string
+        return sys.intern(input_string)
 
     @classmethod
     def should_correct_input(cls, auto_correct_override: Optional[bool]) -> bool:
@@ -128,29 +221,32 @@ class FieldType:
         Returns True if input is valid, else False.
         Raises exc instead of return False if raise_exc.
         """
-        exc = None
+        if cls._regex_only_validation:
+            if cls.matches_regex(input_string):
+                return True
+            if not raise_exc:
+                return False
         try:
             cls.do_validation(input_string, *args, **kwargs)
-        except Exception as validation_exc:
-            exc = validation_exc
+        except Exception:
+            if raise_exc:
+                raise
+            return False
+        return True
 
-        if not exc:
+    @classmethod
+    def matches_regex(cls, input_string: str) -> bool:
+        """Returns True if input is empty or matches regex (or there is no regex)."""
+        if not cls.regex or not input_string:
             return True
-        if not raise_exc:
-            return False
-        raise exc
+        return cls.regex.match(input_string) is not None
 
     @classmethod
     def do_validation(cls, input_string: str, *args, **kwargs) -> None:
         """
         Validates input string. If invalid, raises exception, else returns None.
         """
-        if not cls.regex:
-            return
-        is_match = input_string == getattr(
-            re.match(cls.regex, input_string), "string", ""
-        )
-        if not is_match:
+        if not cls.matches_regex(input_string):
             raise ValueMismatchesFieldTypeError(
                 input_string, cls.regex.pattern or cls.__name__
             )
@@ -163,6 +259,7 @@ class IntegerFieldType(FieldType):
     alignment: Alignment = Alignment.RIGHT
     regex: re.Pattern = re.compile(r"^\d+$")
     auto_correct: bool = False
+    line_character_class: Optional[str] = r"\d"
 
 
 class AlphaNumFieldType(FieldType):
@@ -172,6 +269,7 @@ class AlphaNumFieldType(FieldType):
     alignment: Alignment = Alignment.LEFT
     regex: re.Pattern = re.compile(r"^[A-Za-z0-9./()&\'\s-]+$")
     auto_correct: bool = True
+    line_character_class: Optional[str] = r"[A-Za-z0-9./()&\'\s-]"
 
     @classmethod
     def correct_input(
@@ -182,7 +280,7 @@ class AlphaNumFieldType(FieldType):
         """
         if not cls.should_correct_input(auto_correct_override):
             return input_string
-        return re.sub(re.compile(r"[^A-Za-z0-9./()&\'\s-]"), "", input_string)
+        return _ALPHANUM_INVALID_CHARACTERS_REGEX.sub("", input_string)
 
 
 class BlankPaddedRoutingNumberFieldType(IntegerFieldType):
@@ -202,7 +300,7 @@ class BlankPaddedRoutingNumberFieldType(IntegerFieldType):
             return input_string
         if not input_string:
             return ""
-        if cls.is_valid(input_string):
+        if cls.regex.match(input_string):
             return input_string
         if input_string.lstrip().isdigit():
             return Alignment.RIGHT.align(input_string, 9, "0")
@@ -218,31 +316,27 @@ class DateFieldType(AlphaNumFieldType):
 
     regex: re.Pattern = re.compile(r"^\d{6}$")
     auto_correct: bool = True
+    time_dependent: bool = True
 
     @classmethod
     def correct_input(
         cls, input_string: str, auto_correct_override: Optional[bool] = None
     ) -> str:
-        if not cls.should_correct_input(auto_correct_override) or cls.is_valid(
-            input_string
-        ):
+        if not cls.should_correct_input(auto_correct_override):
             return input_string
 
+        # Auto inputs are never valid; check them first to skip validating them.
         if input_string.upper() == AutoDateInput.NOW.value:
-            return datetime.date.today().strftime("%y%m%d")
+            return _format_now("%y%m%d")
 
         if input_string.upper() == AutoDateInput.TOMORROW.value:
-            return (datetime.date.today() + datetime.timedelta(days=1)).strftime(
-                "%y%m%d"
-            )
+            return _format_now("%y%m%d", days=1)
 
-        with suppress(ValueError):
-            return datetime.datetime.fromisoformat(input_string).strftime("%y%m%d")
+        if cls.is_valid(input_string):
+            return input_string
 
-        with suppress(ValueError):
-            return datetime.date.fromisoformat(input_string).strftime("%y%m%d")
-
-        return input_string
+        formatted = _format_iso_datetime(input_string, "%y%m%d")
+        return input_string if formatted is None else formatted
 
     @classmethod
     def do_validation(cls, input_string: str, *args, **kwargs) -> None:
@@ -265,29 +359,27 @@ class TimeFieldType(AlphaNumFieldType):
 
     regex: re.Pattern = re.compile(r"^\d{4}$")
     auto_correct: bool = True
+    time_dependent: bool = True
 
     @classmethod
     def correct_input(
         cls, input_string: str, auto_correct_override: Optional[bool] = None
     ) -> str:
-        if not cls.should_correct_input(auto_correct_override) or cls.is_valid(
-            input_string
-        ):
+        if not cls.should_correct_input(auto_correct_override):
             return input_string
 
+        # Auto inputs are never valid; check them first to skip validating them.
         if input_string.upper() == AutoDateInput.NOW.value:
-            return datetime.datetime.now().strftime("%H%M")
+            return _format_now("%H%M")
 
         if input_string.upper() == AutoDateInput.TOMORROW.value:
             return (datetime.date.today() + datetime.timedelta(days=1)).strftime("%H%M")
 
-        with suppress(ValueError):
-            return datetime.datetime.fromisoformat(input_string).strftime("%H%M")
-
-        with suppress(ValueError):
-            return datetime.date.fromisoformat(input_string).strftime("%H%M")
+        if cls.is_valid(input_string):
+            return input_string
 
-        return input_string
+        formatted = _format_iso_datetime(input_string, "%H%M")
+        return input_string if formatted is None else formatted
 
     @classmethod
     def do_validation(cls, input_string: str, *args, **kwargs) -> None:
@@ -315,8 +407,13 @@ class FieldDefinition:
         required: bool -- whether value needs to be non-blank
         default: Optional[str] -- if no value is provided to Field,
             defines what is automatically set as the Field's value
+        modification_count: int -- count of public attribute assignments on this
+            FieldDefinition; lets values derived from it detect when it changed
     """
 
+    modification_count: int = 0
+    _cleaned_default: Optional[Tuple[int, Optional[str]]] = None
+
     # pylint: disable=too-many-arguments
     def __init__(
         self,
@@ -334,6 +431,13 @@ class FieldDefinition:
         self.default = str(default) if default is not None else None
         self.auto_correct_input = auto_correct_input
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        global _DEFINITIONS_VERSION  # pylint: disable=global-statement
+        super().__setattr__(name, value)
+        if name != "modification_count" and not name.startswith("_"):
+            super().__setattr__("modification_count", self.modification_count + 1)
+            _DEFINITIONS_VERSION += 1
+
     # pylint: disable=consider-using-f-string
     def __repr__(self) -> str:
         return "<{}: {} [{}]>".format(
@@ -359,6 +463,27 @@ class FieldDefinition:
         """Convert input string to fixed length according to its FieldType."""
         return self.field_type.apply_fixed_length(input_string, self.length)
 
+    def get_cleaned_default(self) -> Optional[str]:
+        """
+        Get the cleaned value a Field takes when given no value, computed once
+        until an attribute is reassigned. Returns None if it has to be computed
+        per Field: time-dependent field types, required fields with no default,
+        and defaults that fail validation (so they keep raising per Field).
+        """
+        if (
+            self._cleaned_default is not None
+            and self._cleaned_default[0] == self.modification_count
+        ):
+            return self._cleaned_default[1]
+        cleaned_default = None
+        if not self.field_type.time_dependent and not (
+            self.required and self.default is None
+        ):
+            with suppress(Exception):
+                cleaned_default = Field.clean_value(self)
+        self._cleaned_default = (self.modification_count, cleaned_default)
+        return cleaned_default
+
 
 class Field:
     """
@@ -374,12 +499,28 @@ class Field:
             if raw input value is invalid
     """
 
+    __slots__ = ("field_definition", "original_value", "cleaned_value")
+
     # pylint: disable=too-few-public-methods
     def __init__(self, field_definition: FieldDefinition, value: Optional[str] = None):
         self.field_definition = field_definition
         self.original_value = value
         self.value = value
 
+    @classmethod
+    def from_cleaned_value(
+        cls, field_definition: FieldDefinition, cleaned_value: str
+    ) -> "Field":
+        """
+        Create a Field from a value already cleaned for its field definition,
+        skipping correction and validation. Original value is None.
+        """
+        field = cls.__new__(cls)
+        field.field_definition = field_definition
+        field.original_value = None
+        field.cleaned_value = cleaned_value
+        return field
+
     @property
     def value(self) -> str:
         """Return cleaned value of field (not original value)."""
@@ -395,13 +536,28 @@ class Field:
     @staticmethod
     def _create_cleaned_value(
         field_definition: FieldDefinition, value: Optional[str] = None
-    ):
+    ) -> str:
+        if value is None:
+            cleaned_default = field_definition.get_cleaned_default()
+            if cleaned_default is not None:
+                return cleaned_default
+        return Field.clean_value(field_definition, value)
+
+    @staticmethod
+    def clean_value(
+        field_definition: FieldDefinition, value: Optional[str] = None
+    ) -> str:
+        """
+        Correct, validate and pad a raw value (or the field default, if None)
+        according to a field definition. Raises if the result is invalid.
+        """
         Field._validate_required_value_not_empty(field_definition, value)
 
         ret_value: str = ""
-        if isinstance(value, (datetime.date, datetime.datetime)):
-            ret_value = value.isoformat()
-        ret_value = str(field_definition.default or "") if value is None else str(value)
+        if value is not None:
+            ret_value = str(value)
+        elif field_definition.default is not None:
+            ret_value = field_definition.default
 
         ret_value = field_definition.correct_input(ret_value)
 
@@ -2,10 +2,31 @@
 Defines base RecordType class. Validates FieldDefinition arrays and instantiates Fields.
 """
 
-from typing import Any, Dict, List, Optional
+import re
+import sys
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
 from ..constants import RECORD_SIZE
-from .record_fields import Field, FieldDefinition
+from .record_fields import (
+    EmptyRequiredFieldError,
+    Field,
+    FieldDefinition,
+    get_definitions_version,
+)
+
+# FieldDefinition methods a line_character_class assumes are not overridden.
+_FIELD_DEFINITION_CLEANING_METHODS = (
+    "correct_input",
+    "is_valid",
+    "get_fixed_width_value",
+)
+
+
+class _MatchedLineValue(str):
+    """
+    Field value sliced from a record line that matched its RecordType's
+    line pattern, so it is already valid and needs no cleaning.
+    """
 
 
 class InvalidRecordSizeError(Exception):
@@ -81,34 +102,103 @@ class RecordType:
     """
     Base class for record types.
     Renders Fields as a record line by validating FieldDefinitions and generating Fields from them.
+
+    Subclasses declaring their own field_definition_dict are validated against
+    desired_record_size when the class is created.
     """
 
     field_definition_dict: Dict[str, FieldDefinition] = {}
+    desired_record_size: int = RECORD_SIZE
+
+    # Derived from field_definition_dict; see _get_field_definition_items.
+    _field_definition_items: Tuple[Tuple[str, FieldDefinition], ...] = ()
+    _total_length: int = 0
+    _field_names: Tuple[str, ...] = ()
+    _required_field_names: Tuple[str, ...] = ()
+    _field_slices: Tuple[Tuple[str, slice], ...] = ()
+    _field_slice_map: Dict[str, slice] = {}
+    _line_regex: Optional[re.Pattern] = None
+    _line_checked_keys: FrozenSet[str] = frozenset()
+    _required_keys: FrozenSet[str] = frozenset()
+    _required_kwargs: Dict[str, FieldDefinition] = {}
+    _cleaned_defaults: Dict[str, str] = {}
+    _cached_field_definition_dict: Optional[Dict[str, FieldDefinition]] = None
+    _cached_definitions_version: int = -1
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._cache_field_definitions()
+        if "field_definition_dict" in cls.__dict__:
+            cls._validate_record_size(cls._total_length, cls.desired_record_size)
 
     def __init__(
         self,
         field_definition_dict: Optional[Dict[str, FieldDefinition]] = None,
-        desired_record_size: int = RECORD_SIZE,
+        desired_record_size: Optional[int] = None,
         **kwargs
     ):
+        if desired_record_size is None:
+            desired_record_size = self.desired_record_size
+
         if field_definition_dict:
             self.field_definition_dict = field_definition_dict
 
-        self._validate_field_definition_list(
-            self.field_definition_dict, desired_record_size
+        use_class_caches = (
+            self.field_definition_dict is type(self).field_definition_dict
         )
+        if use_class_caches:
+            field_definition_items = self._get_field_definition_items()
+            total_length = self._total_length
+        else:
+            field_definition_items = tuple(self.field_definition_dict.items())
+            total_length = sum(x.length for _, x in field_definition_items)
+
+        self._validate_record_size(total_length, desired_record_size)
         self._validate_no_unknown_key_arguments(self.field_definition_dict, kwargs)
 
         self.fields: Dict[str, Field] = self._generate_fields_dict(
-            self.field_definition_dict, kwargs
+            field_definition_items, kwargs, use_class_caches
         )
 
+    @classmethod
+    def from_line(cls, line: str) -> "RecordType":
+        """
+        Create a record of this type from a single fixed-width record line,
+        passing each field's slice of the line in as its raw value.
+        """
+        field_slices = cls._get_field_slices()
+        if cls._line_regex is None or not cls._line_regex.fullmatch(line):
+            return cls(**{key: line[x] for key, x in field_slices})
+        checked_keys = cls._line_checked_keys
+        return cls(
+            **{
+                key: _MatchedLineValue(line[x]) if key in checked_keys else line[x]
+                for key, x in field_slices
+            }
+        )
+
+    @classmethod
+    def read_line_field_values(cls, line: str, *field_names: str) -> Dict[str, str]:
+        """
+        Read field values straight from a fixed-width record line
+        without creating a record; returns all fields if no names are given.
+        Values are the raw slices of the line and are not validated.
+        """
+        if not field_names:
+            return {key: line[x] for key, x in cls._get_field_slices()}
+        cls._get_field_definition_items()
+        unknown_keys = [x for x in field_names if x not in cls._field_slice_map]
+        if unknown_keys:
+            raise InvalidRecordTypeParametersError(cls.__name__, unknown_keys)
+        return {x: line[cls._field_slice_map[x]] for x in field_names}
+
     def render_record_line(self) -> str:
         """Render single record as a line in a valid ACH file."""
-        result = ""
-        for field in self.fields.values():
-            result += field.value
-        return result
+        return "".join([field.value for field in self.fields.values()])
+
+    def __bytes__(self) -> bytes:
+        """Render single record as an ASCII-encoded line; see render_record_line."""
+        return self.render_record_line().encode("ascii")
 
     @classmethod
     def get_required_kwargs(cls) -> Dict[str, FieldDefinition]:
@@ -116,11 +206,19 @@ class RecordType:
         Get required kwargs that have no defaults set.
         Returns keys mapped to FieldDefinitions.
         """
-        required_kwargs = {}
-        for field_def_key, field_def in cls.field_definition_dict.items():
-            if field_def.required and field_def.default is None:
-                required_kwargs[field_def_key] = field_def
-        return required_kwargs
+        cls._get_field_definition_items()
+        return dict(cls._required_kwargs)
+
+    @classmethod
+    def field_names(cls, only_required: bool = False) -> Tuple[str, ...]:
+        """
+        Get field names in record order.
+        If only_required, returns only required names that have no defaults set.
+        """
+        cls._get_field_definition_items()
+        if only_required:
+            return cls._required_field_names
+        return cls._field_names
 
     def get_field_value(self, field_name: str) -> str:
         """Get cleaned Field value of given field name."""
@@ -168,19 +266,46 @@ class RecordType:
             ) from exceptions[0]
 
     def _generate_fields_dict(
-        self, field_def_dict: Dict, kwargs: Dict
+        self,
+        field_definition_items: Tuple[Tuple[str, FieldDefinition], ...],
+        kwargs: Dict,
+        use_class_caches: bool = False,
     ) -> Dict[str, Field]:
+        """
+        Create a Field for each definition from kwargs. If use_class_caches,
+        the definitions are the class's own, so its cached required keys,
+        cleaned defaults and line-checked keys apply to them.
+        """
+        if use_class_caches:
+            required_keys = self._required_keys
+            cleaned_defaults = self._cleaned_defaults
+            line_checked_keys = self._line_checked_keys
+        else:
+            required_keys = self._get_required_keys(field_definition_items)
+            cleaned_defaults, line_checked_keys = {}, frozenset()
         fields = {}
         failed_keys, exceptions = [], []
-        for key in field_def_dict:
-            self._catch_set_value_on_field_errors(
-                failed_keys,
-                exceptions,
-                key,
-                kwargs.get(key),
-                field_def_dict=field_def_dict,
-                fields_dict=fields,
-            )
+        for key, field_def in field_definition_items:
+            value = kwargs.get(key)
+            if key in line_checked_keys and isinstance(value, _MatchedLineValue):
+                field = Field.from_cleaned_value(
+                    field_def, field_def.field_type.intern_if_padding(str(value))
+                )
+                field.original_value = field.cleaned_value
+                fields[key] = field
+                continue
+            if value is None and key in cleaned_defaults:
+                fields[key] = Field.from_cleaned_value(field_def, cleaned_defaults[key])
+                continue
+            if value is None and key in required_keys:
+                failed_keys.append(key)
+                exceptions.append(EmptyRequiredFieldError(field_def.field_name))
+                continue
+            try:
+                fields[key] = Field(field_def, value)
+            except Exception as exc:
+                failed_keys.append(key)
+                exceptions.append(exc)
         if exceptions:
             raise RecordTypeAggregateFieldCreationError(
                 type(self).__name__, exceptions, failed_keys
@@ -213,11 +338,115 @@ class RecordType:
         field_definition_dict: Dict[str, FieldDefinition],
         desired_record_size: int = RECORD_SIZE,
     ) -> None:
-        resulting_record_size = 0
-        for field_def in field_definition_dict.values():
-            resulting_record_size += field_def.length
+        cls._validate_record_size(
+            sum(x.length for x in field_definition_dict.values()), desired_record_size
+        )
 
+    @classmethod
+    def _validate_record_size(
+        cls, resulting_record_size: int, desired_record_size: int = RECORD_SIZE
+    ) -> None:
         if resulting_record_size != desired_record_size:
             raise InvalidRecordSizeError(
                 cls.__name__, resulting_record_size, desired_record_size
             )
+
+    @classmethod
+    def _get_field_definition_items(cls) -> Tuple[Tuple[str, FieldDefinition], ...]:
+        """
+        Return class field definitions as ordered (key, FieldDefinition) pairs,
+        rebuilding the cached values if field_definition_dict was replaced,
+        or any FieldDefinition was created or changed since they were built.
+        """
+        if (
+            cls._cached_definitions_version != get_definitions_version()
+            or cls._cached_field_definition_dict is not cls.field_definition_dict
+        ):
+            cls._cache_field_definitions()
+        return cls._field_definition_items
+
+    @classmethod
+    def _get_field_slices(cls) -> Tuple[Tuple[str, slice], ...]:
+        """Return (key, slice of record line) pairs for each field, in order."""
+        cls._get_field_definition_items()
+        return cls._field_slices
+
+    @classmethod
+    def _cache_field_definitions(cls) -> None:
+        cls._field_definition_items = tuple(
+            (sys.intern(key), field_def)
+            for key, field_def in cls.field_definition_dict.items()
+        )
+        field_slices = []
+        offset = 0
+        for key, field_def in cls._field_definition_items:
+            field_slices.append((key, slice(offset, offset + field_def.length)))
+            offset += field_def.length
+        cls._field_slices = tuple(field_slices)
+        cls._field_slice_map = dict(field_slices)
+        cls._line_regex, cls._line_checked_keys = cls._get_line_regex(
+            cls._field_definition_items
+        )
+        cls._total_length = offset
+        cls._required_keys = cls._get_required_keys(cls._field_definition_items)
+        cls._required_kwargs = {
+            key: field_def
+            for key, field_def in cls._field_definition_items
+            if key in cls._required_keys
+        }
+        cls._field_names = tuple(key for key, _ in cls._field_definition_items)
+        cls._required_field_names = tuple(cls._required_kwargs)
+        cls._cleaned_defaults = cls._get_cleaned_defaults(cls._field_definition_items)
+        cls._cached_field_definition_dict = cls.field_definition_dict
+        cls._cached_definitions_version = get_definitions_version()
+
+    @staticmethod
+    def _get_required_keys(
+        field_definition_items: Tuple[Tuple[str, FieldDefinition], ...],
+    ) -> FrozenSet[str]:
+        return frozenset(
+            key
+            for key, field_def in field_definition_items
+            if field_def.required and field_def.default is None
+        )
+
+    @staticmethod
+    def _get_line_regex(
+        field_definition_items: Tuple[Tuple[str, FieldDefinition], ...],
+    ) -> Tuple[Optional[re.Pattern], FrozenSet[str]]:
+        """
+        Build one pattern for a whole record line out of each field type's
+        line_character_class, so a single match checks all of those fields.
+        Fields without one, or whose FieldDefinition class changes how values
+        are cleaned, are matched by length only and cleaned as usual.
+        Returns the pattern (None if no field can be checked) and checked keys.
+        """
+        patterns, checked_keys = [], []
+        for key, field_def in field_definition_items:
+            character_class = field_def.field_type.line_character_class
+            if character_class and not any(
+                getattr(type(field_def), x) is not getattr(FieldDefinition, x)
+                for x in _FIELD_DEFINITION_CLEANING_METHODS
+            ):
+                patterns.append("{}{{{}}}".format(character_class, field_def.length))
+                checked_keys.append(key)
+            else:
+                patterns.append(".{{{}}}".format(field_def.length))
+        if not checked_keys:
+            return None, frozenset()
+        return re.compile("".join(patterns), re.DOTALL), frozenset(checked_keys)
+
+    @staticmethod
+    def _get_cleaned_defaults(
+        field_definition_items: Tuple[Tuple[str, FieldDefinition], ...],
+    ) -> Dict[str, str]:
+        """
+        Collect the value each field takes when no value is passed in,
+        for fields whose FieldDefinition can reuse it (see get_cleaned_default).
+        """
+        cleaned_defaults = {}
+        for key, field_def in field_definition_items:
+            cleaned_default = field_def.get_cleaned_default()
+            if cleaned_default is not None:
+                cleaned_defaults[key] = cleaned_default
+        return cleaned_defaults
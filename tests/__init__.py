@@ -1,2 +1,15 @@
+from functools import lru_cache
+
+from ach.files import ACHFileContentsParser
+
 with open("tests/sample_test_file.ach", "r") as f:
     test_file = f.read()
+
+
+@lru_cache(maxsize=None)
+def parsed_test_file():
+    """
+    Return test_file parsed into ACHFileContents, parsed only once.
+    Shared between tests: parse test_file anew in tests that modify it.
+    """
+    return ACHFileContentsParser(test_file).process_ach_file_contents()
@@ -1,5 +1,6 @@
 """Tests ACH file builder."""
 
+import io
 from unittest import TestCase
 
 from ach.files import ACHFileBuilder, ACHFileContentsParser, NoBatchForTransactionError
@@ -13,7 +14,7 @@ from ach.record_types.record_fields import (
     BlankPaddedRoutingNumberFieldType,
 )
 from ach.constants import AutoDateInput, BatchStandardEntryClassCode, TransactionCode
-from tests import test_file
+from tests import parsed_test_file, test_file
 
 
 class TestDisplayRequiredKeys(TestCase):
@@ -44,7 +45,7 @@ class TestDisplayRequiredKeys(TestCase):
             "file_creation_date",
             "file_creation_time",
             "file_id_modifier",
-            "record size",
+            "record_size",
             "blocking_factor",
             "format_code",
             "destination_name",
@@ -335,10 +336,7 @@ class TestACHFileBuilder(TestCase):
         )
 
     def test_ach_file_builder_build_from_parser_output(self):
-        parser = ACHFileContentsParser(test_file)
-        ach_file_contents = parser.process_ach_file_contents(
-            parser.process_records_list()
-        )
+        ach_file_contents = parsed_test_file()
 
         builder = self.ach_file_builder_class(
             **ach_file_contents.file_header_record.get_field_values()
@@ -359,6 +357,52 @@ class TestACHFileBuilder(TestCase):
 
         self.assertEqual(test_file, builder.render())
 
+    def test_ach_file_builder_from_file_contents(self):
+        ach_file_contents = ACHFileContentsParser(test_file).process_ach_file_contents()
+        builder = self.ach_file_builder_class.from_file_contents(ach_file_contents)
+        self.assertIs(builder.ach_file_contents, ach_file_contents)
+        self.assertEqual(test_file, builder.render())
+
+        builder.add_entry_and_addenda(
+            transaction_code=22,
+            rdfi_routing="123456789",
+            rdfi_account_number="65656565",
+            amount="300",
+            individual_name="Janey Test",
+        )
+        entry = ach_file_contents.batches[-1].transactions[-1].entry
+        self.assertEqual(entry.get_field_value("trace_odfi_identifier"), "12345678")
+        self.assertEqual(int(entry.get_field_value("trace_sequence_number")), 4)
+
+    def test_ach_file_builder_subclass_from_file_contents(self):
+        class NotesFileBuilder(self.ach_file_builder_class):
+            def __init__(self, **kwargs):
+                super().__init__(**kwargs)
+                self.notes = []
+
+        builder = NotesFileBuilder.from_file_contents(
+            ACHFileContentsParser(test_file).process_ach_file_contents()
+        )
+        self.assertEqual(builder.notes, [])
+        self.assertEqual(builder.default_odfi_identification, "12345678")
+
+    def test_ach_file_builder_file_contents_with_file_settings(self):
+        with self.assertRaises(TypeError):
+            self.ach_file_builder_class(
+                ach_file_contents=ACHFileContentsParser(
+                    test_file
+                ).process_ach_file_contents(),
+                origin_routing="102345678",
+            )
+
+    def test_ach_file_builder_write(self):
+        builder = self.ach_file_builder_class.from_file_contents(
+            ACHFileContentsParser(test_file).process_ach_file_contents()
+        )
+        file_obj = io.StringIO()
+        self.assertEqual(builder.write(file_obj), len(test_file))
+        self.assertEqual(file_obj.getvalue(), test_file)
+
     def test_add_transaction_before_batch(self):
         b = self.ach_file_builder_class(
             destination_routing="012345678",
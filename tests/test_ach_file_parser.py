@@ -1,8 +1,13 @@
 """Test file_parser.py"""
 
+import io
 from unittest import TestCase
 
-from ach.files import ACHFileContentsParser
+from ach.files import (
+    ACHFileContentsParser,
+    RecordOutOfOrderError,
+    UnknownRecordTypeCodeError,
+)
 from tests import test_file
 
 
@@ -20,9 +25,64 @@ class TestParser(TestCase):
         self.assertEqual(ach_file_contents.render_file_contents(), test_file)
 
     def test_parse_lines_to_dicts(self):
-        parser = ACHFileContentsParser(test_file)
+        parser = ACHFileContentsParser(ach_file_str=test_file)
         records_list = parser.process_records_list()
         record_dicts = parser.get_record_fields_dict_list(records_list)
         for i, record_dict in enumerate(record_dicts):
             for key, val in record_dict.items():
                 self.assertEqual(val, records_list[i].get_field_value(key))
+
+    def test_parse_file_object(self):
+        parser = ACHFileContentsParser(io.StringIO(test_file), retain_records=True)
+        ach_file_contents = parser.process_ach_file_contents()
+
+        self.assertEqual(ach_file_contents.render_file_contents(), test_file)
+        self.assertEqual(
+            [x.render_record_line() for x in parser.records_list],
+            test_file.splitlines()[: len(parser.records_list)],
+        )
+
+    def test_iter_records_crlf_lines(self):
+        lines = test_file.splitlines()
+        parser = ACHFileContentsParser(line + "\r\n" for line in lines)
+        records = list(parser.iter_records())
+        self.assertEqual(
+            [x.render_record_line() for x in records], lines[: len(records)]
+        )
+
+    def test_parse_bytes_and_binary_file_object(self):
+        raw = test_file.replace("\n", "\r\n").encode("ascii")
+        for source in (raw, io.BytesIO(raw), raw.splitlines(keepends=True)):
+            ach_file_contents = ACHFileContentsParser(
+                source
+            ).process_ach_file_contents()
+            self.assertEqual(ach_file_contents.render_file_contents(), test_file)
+
+    def test_iter_line_field_values(self):
+        records_list = ACHFileContentsParser(test_file).process_records_list()
+        line_dicts = list(
+            ACHFileContentsParser(test_file).iter_line_field_values(
+                "record_type_code", "amount"
+            )
+        )
+        self.assertEqual(len(line_dicts), len(records_list))
+        for record, line_dict in zip(records_list, line_dicts):
+            for key, val in line_dict.items():
+                self.assertEqual(val, record.get_field_value(key))
+            self.assertEqual(
+                "amount" in line_dict, "amount" in record.field_definition_dict
+            )
+
+    def test_unknown_record_type_code(self):
+        lines = test_file.splitlines()
+        lines.insert(1, "4" * 94)
+        with self.assertRaises(UnknownRecordTypeCodeError):
+            ACHFileContentsParser("\n".join(lines)).process_records_list()
+
+    def test_records_out_of_order(self):
+        lines = test_file.splitlines()
+        for index, line in ((0, lines[1]), (1, lines[2]), (2, lines[3])):
+            out_of_order_lines = lines[:index] + [line]
+            with self.assertRaises(RecordOutOfOrderError) as ctx:
+                ACHFileContentsParser(out_of_order_lines).process_ach_file_contents()
+            self.assertIn(line, str(ctx.exception))
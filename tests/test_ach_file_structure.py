@@ -15,7 +15,7 @@ from ach.record_types import (
     EntryDetailRecordType,
     FileHeaderRecordType,
 )
-from tests import test_file
+from tests import parsed_test_file, test_file
 
 
 class TestACHFileContents(TestCase):
@@ -109,8 +109,24 @@ class TestACHFileContents(TestCase):
         )
 
     def test_compute_line_count(self):
-        ach_file_contents = ACHFileContentsParser(test_file).process_ach_file_contents()
-        self.assertEqual(ach_file_contents._compute_line_count(), 8)
+        self.assertEqual(parsed_test_file()._compute_line_count(), 8)
+
+    def test_compute_block_count(self):
+        ach_file_contents = parsed_test_file()
+        self.assertEqual(ach_file_contents._compute_block_count(), 1)
+        for line_count, block_count in ((10, 1), (11, 2), (20, 2), (21, 3)):
+            self.assertEqual(
+                ach_file_contents._compute_block_count(line_count=line_count),
+                block_count,
+            )
+
+    def test_get_transaction_count(self):
+        ach_file_contents = parsed_test_file()
+        self.assertEqual(
+            ach_file_contents.get_transaction_count(),
+            len(ach_file_contents.get_all_transactions()),
+        )
+        self.assertEqual(ach_file_contents.get_transaction_count(), 3)
 
     def test_add_batch_recalculates_control_records(self):
         ach_file_contents = ACHFileContentsParser(test_file).process_ach_file_contents()
@@ -149,3 +165,82 @@ class TestACHFileContents(TestCase):
         self.assertEqual(
             int(ach_file_contents.file_control_record.get_field_value("batch_count")), 2
         )
+
+
+class TestACHBatch(TestCase):
+    def _get_transaction(self, transaction_code, amount, sequence_number):
+        return ACHTransactionEntry(
+            EntryDetailRecordType(
+                transaction_code=transaction_code,
+                rdfi_routing="012345678",
+                rdfi_account_number="0123456",
+                amount=amount,
+                individual_name="Hello Darling",
+                trace_odfi_identifier=12345678,
+                trace_sequence_number=sequence_number,
+            )
+        )
+
+    def _get_control_totals(self, batch):
+        return tuple(
+            int(batch.batch_control_record.get_field_value(x))
+            for x in (
+                "entry_and_addenda_count",
+                "entry_hash",
+                "total_debit_amount",
+                "total_credit_amount",
+            )
+        )
+
+    def test_batch_control_totals_follow_transactions(self):
+        batch = ACHBatch(
+            BatchHeaderRecordType(
+                company_name="Test Company",
+                company_identification="0912",
+                company_entry_description="Various",
+                odfi_identification="12345678",
+                batch_number=1,
+            ),
+            transactions=[self._get_transaction(27, 100, 1)],
+        )
+        self.assertEqual(self._get_control_totals(batch), (1, 1234567, 100, 0))
+
+        batch.add_transaction(self._get_transaction(22, 250, 2))
+        self.assertEqual(self._get_control_totals(batch), (2, 2469134, 100, 250))
+
+        batch.remove_transaction_by_index(0)
+        self.assertEqual(self._get_control_totals(batch), (1, 1234567, 0, 250))
+
+        batch.transactions.append(self._get_transaction(27, 5, 3))
+        batch.add_transaction(self._get_transaction(27, 7, 4))
+        self.assertEqual(self._get_control_totals(batch), (3, 3703701, 12, 250))
+
+        batch.add_transactions(
+            [self._get_transaction(22, 1, 5), self._get_transaction(27, 2, 6)]
+        )
+        self.assertEqual(self._get_control_totals(batch), (5, 6172835, 14, 251))
+
+    def test_batch_control_totals_follow_changed_transactions(self):
+        batch = ACHBatch(
+            BatchHeaderRecordType(
+                company_name="Test Company",
+                company_identification="0912",
+                company_entry_description="Various",
+                odfi_identification="12345678",
+                batch_number=1,
+            )
+        )
+        batch.add_transaction(self._get_transaction(22, 100, 1))
+        batch.add_transaction(self._get_transaction(22, 200, 2))
+        batch.transactions[0].entry.set_field_value("amount", 5000)
+        batch.transactions[1] = self._get_transaction(27, 300, 2)
+        self.assertEqual(self._get_control_totals(batch), (2, 2469134, 300, 5000))
+
+    def test_transaction_debit_and_credit_amounts(self):
+        for transaction_code, amounts in ((27, (100, 0)), (22, (0, 100))):
+            transaction = self._get_transaction(transaction_code, 100, 1)
+            self.assertEqual(transaction.get_debit_and_credit_amounts(), amounts)
+            self.assertEqual(
+                amounts,
+                (transaction.get_debit_amount(), transaction.get_credit_amount()),
+            )
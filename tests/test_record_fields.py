@@ -1,6 +1,7 @@
 """Tests record_fields.py"""
 
 import datetime
+import re
 from unittest import TestCase
 
 from ach.record_types.record_fields import (
@@ -143,6 +144,61 @@ class TestFieldTypeValidation(TestCase):
                     ),
                 )
 
+    def test_line_character_class_not_inherited(self):
+        self.assertEqual(IntegerFieldType.line_character_class, r"\d")
+        self.assertIsNone(BlankPaddedRoutingNumberFieldType.line_character_class)
+        self.assertIsNone(DateFieldType.line_character_class)
+
+        class UpperAlphaFieldType(AlphaNumFieldType):
+            regex = re.compile(r"^[A-Z ]+$")
+
+        class SpacedIntegerFieldType(IntegerFieldType):
+            padding = " "
+
+        class DigitsFieldType(IntegerFieldType):
+            line_character_class = r"[0-9]"
+
+        self.assertIsNone(UpperAlphaFieldType.line_character_class)
+        self.assertIsNone(SpacedIntegerFieldType.line_character_class)
+        self.assertEqual(DigitsFieldType.line_character_class, r"[0-9]")
+
+    def test_apply_fixed_length(self):
+        cases = [
+            (AlphaNumFieldType, "Teeniest Fintech", 20, "Teeniest Fintech    "),
+            (AlphaNumFieldType, "Teeniest Fintech", 8, "Teeniest"),
+            (AlphaNumFieldType, "Teeniest", 8, "Teeniest"),
+            (IntegerFieldType, "42", 6, "000042"),
+            (IntegerFieldType, "1234567", 6, "234567"),
+        ]
+        for field_type, input_string, length, output in cases:
+            self.assertEqual(
+                field_type.apply_fixed_length(input_string, length), output
+            )
+
+    def test_is_valid_without_raise_exc_skips_building_error(self):
+        class CountingFieldType(IntegerFieldType):
+            calls = 0
+
+            @classmethod
+            def do_validation(cls, input_string, *args, **kwargs):
+                cls.calls += 1
+                super().do_validation(input_string, *args, **kwargs)
+
+        self.assertTrue(IntegerFieldType._regex_only_validation)
+        self.assertFalse(DateFieldType._regex_only_validation)
+        self.assertFalse(CountingFieldType._regex_only_validation)
+        self.assertFalse(CountingFieldType.is_valid("12a"))
+        self.assertEqual(CountingFieldType.calls, 1)
+        self.assertFalse(IntegerFieldType.is_valid("12a"))
+        self.assertTrue(IntegerFieldType.is_valid(""))
+        self.assertFalse(DateFieldType.is_valid("991332"))
+        self.assertRaises(
+            ValueMismatchesFieldTypeError,
+            IntegerFieldType.is_valid,
+            "12a",
+            raise_exc=True,
+        )
+
 
 class TestFieldIntegerFieldType(TestCase):
     def test_field_int_default_value_as_string(self):
@@ -171,6 +227,25 @@ class TestFieldIntegerFieldType(TestCase):
         field_def = FieldDefinition("record_type", IntegerFieldType, length=1)
         self.assertEqual(Field(field_def, 2).value, "2")
 
+    def test_field_int_default_cleaned_once(self):
+        field_def = FieldDefinition(
+            "record_type", IntegerFieldType, length=3, default=7
+        )
+        self.assertEqual(field_def.get_cleaned_default(), "007")
+        self.assertIs(Field(field_def).value, field_def.get_cleaned_default())
+        field_def.default = "8"
+        self.assertEqual(Field(field_def).value, "008")
+
+        field_def.default = "not an int"
+        self.assertIsNone(field_def.get_cleaned_default())
+        self.assertRaises(ValueMismatchesFieldTypeError, Field, field_def)
+
+    def test_field_int_zero_value_overrides_default(self):
+        field_def = FieldDefinition(
+            "record_type", IntegerFieldType, length=2, default=1
+        )
+        self.assertEqual(Field(field_def, 0).value, "00")
+
     def test_field_int_not_required_no_default(self):
         field_def = FieldDefinition(
             "record_type", IntegerFieldType, length=1, required=False
@@ -223,6 +298,15 @@ class TestFieldAlphaNumFieldType(TestCase):
         )
         self.assertEqual(Field(field_def).value, " ")
 
+    def test_field_alphanum_blank_values_shared(self):
+        field_def = FieldDefinition(
+            "discretionary_data", AlphaNumFieldType, length=20, required=False
+        )
+        self.assertIs(Field(field_def).value, Field(field_def, "  ").value)
+        self.assertIs(
+            Field(field_def).value, Field(field_def, "".join([" "] * 20)).value
+        )
+
     def test_field_alphanum_required_no_default(self):
         field_def = FieldDefinition("record_type", AlphaNumFieldType, length=1)
         self.assertRaises(EmptyRequiredFieldError, Field, field_def)
@@ -313,6 +397,16 @@ class TestDateFieldType(TestCase):
             Field(field_def, "now").value, datetime.date.today().strftime("%y%m%d")
         )
 
+    def test_field_date_input_tomorrow(self):
+        field_def = FieldDefinition(
+            "file_date", DateFieldType, length=6, auto_correct_input=True
+        )
+        tomorrow = datetime.date.today() + datetime.timedelta(days=1)
+        for _ in range(2):
+            self.assertEqual(
+                Field(field_def, "tomorrow").value, tomorrow.strftime("%y%m%d")
+            )
+
     def test_field_date_input_date_type(self):
         field_def = FieldDefinition(
             "file_date", DateFieldType, length=6, auto_correct_input=True
@@ -8,17 +8,53 @@ from ach.record_types import (
     AlphaNumFieldType,
     BatchControlRecordType,
     BatchHeaderRecordType,
+    EmptyRequiredFieldError,
     EntryDetailRecordType,
+    Field,
     FieldDefinition,
     FileControlRecordType,
     FileHeaderRecordType,
     IntegerFieldType,
     InvalidRecordSizeError,
+    InvalidRecordTypeParametersError,
     RecordType,
+    RecordTypeAggregateFieldCreationError,
 )
 
+ENTRY_DETAIL_LINE = "622123456789123456           0000000100               Testy Testface          1012345670000001"
+
+
+def make_94_character_field_definition_dict(
+    additional_field_definition_class=FieldDefinition,
+):
+    """
+    Build new field definitions for a 94-character RecordType subclass,
+    so tests can change them without affecting each other.
+    """
+    return {
+        "record_code": FieldDefinition(
+            "record_code", IntegerFieldType, length=1, required=False
+        ),
+        "additional_field": additional_field_definition_class(
+            "additional_field", AlphaNumFieldType, length=93, required=False
+        ),
+    }
+
 
 class TestRecordType(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Shared by tests that do not modify it.
+        cls.field_definition_dict = {
+            "record_code": FieldDefinition(
+                "record_code", IntegerFieldType, length=1, required=False
+            ),
+            "additional_field": FieldDefinition(
+                "additional_field", AlphaNumFieldType, length=2, required=False
+            ),
+        }
+        return super().setUpClass()
+
     def test_record_type_field_definitions_empty_length(self):
         RecordType({}, desired_record_size=0)
 
@@ -26,66 +62,109 @@ class TestRecordType(TestCase):
         self.assertRaises(InvalidRecordSizeError, RecordType, {}, 1)
 
     def test_record_type_field_definitions_not_empty(self):
-        RecordType(
-            {
-                "record_code": FieldDefinition(
-                    "record_code", IntegerFieldType, length=1, required=False
-                ),
-                "additional_field": FieldDefinition(
-                    "additional_field", AlphaNumFieldType, length=2, required=False
-                ),
-            },
-            desired_record_size=3,
-        )
+        RecordType(self.field_definition_dict, desired_record_size=3)
 
     def test_record_type_field_definitions_not_desired_size_empty(self):
         with self.assertRaises(InvalidRecordSizeError):
-            RecordType(
-                {
-                    "record_code": FieldDefinition(
-                        "record_code", IntegerFieldType, length=1, required=False
-                    ),
-                    "additional_field": FieldDefinition(
-                        "additional_field", AlphaNumFieldType, length=2, required=False
-                    ),
-                },
-                desired_record_size=1,
-            )
+            RecordType(self.field_definition_dict, desired_record_size=1)
 
     def test_record_type_render_line_empty(self):
         record_type = RecordType({}, desired_record_size=0)
         self.assertEqual(record_type.render_record_line(), "")
 
     def test_record_type_render_line_not_empty(self):
-        record_type = RecordType(
-            {
-                "record_code": FieldDefinition(
-                    "record_code", IntegerFieldType, length=1, required=False
-                ),
-                "additional_field": FieldDefinition(
-                    "additional_field", AlphaNumFieldType, length=2, required=False
-                ),
-            },
-            desired_record_size=3,
-        )
+        record_type = RecordType(self.field_definition_dict, desired_record_size=3)
         self.assertEqual(record_type.render_record_line(), "0  ")
 
     def test_record_type_render_line_not_empty_with_kwargs(self):
         record_type = RecordType(
-            {
-                "record_code": FieldDefinition(
-                    "record_code", IntegerFieldType, length=1, required=False
-                ),
-                "additional_field": FieldDefinition(
-                    "additional_field", AlphaNumFieldType, length=2, required=False
-                ),
-            },
+            self.field_definition_dict,
             desired_record_size=3,
             record_code=1,
             additional_field="hello",
         )
         self.assertEqual(record_type.render_record_line(), "1he")
 
+    def test_record_type_bytes(self):
+        record_type = RecordType(
+            self.field_definition_dict, desired_record_size=3, record_code=1
+        )
+        self.assertEqual(bytes(record_type), b"1  ")
+
+    def test_record_type_subclass_picks_up_field_definition_changes(self):
+        class CustomRecordType(RecordType):
+            field_definition_dict = make_94_character_field_definition_dict()
+
+        self.assertEqual(len(CustomRecordType().render_record_line()), 94)
+        CustomRecordType.field_definition_dict["record_code"].length = 2
+        self.assertRaises(InvalidRecordSizeError, CustomRecordType)
+
+    def test_record_type_subclass_picks_up_replaced_field_definition(self):
+        class CustomRecordType(RecordType):
+            field_definition_dict = make_94_character_field_definition_dict()
+
+        self.assertEqual(len(CustomRecordType().render_record_line()), 94)
+        CustomRecordType.field_definition_dict["additional_field"] = FieldDefinition(
+            "additional_field", AlphaNumFieldType, length=79, required=False
+        )
+        self.assertRaises(InvalidRecordSizeError, CustomRecordType)
+
+    def test_record_type_subclass_instance_field_definition_dict(self):
+        class CustomRecordType(RecordType):
+            field_definition_dict = make_94_character_field_definition_dict()
+
+            def __init__(self, **kwargs):
+                self.field_definition_dict = dict(self.field_definition_dict)
+                self.field_definition_dict["additional_field"] = FieldDefinition(
+                    "additional_field",
+                    AlphaNumFieldType,
+                    length=93,
+                    required=False,
+                    default="DEF",
+                )
+                super().__init__(**kwargs)
+
+        self.assertEqual(CustomRecordType().render_record_line()[:4], "0DEF")
+        self.assertEqual(
+            CustomRecordType.from_line("7" + "x" * 93).get_field_values(),
+            {"record_code": "7", "additional_field": "x" * 93},
+        )
+
+    def test_record_type_from_line_custom_field_definition_cleaning(self):
+        class UpperFieldDefinition(FieldDefinition):
+            def correct_input(self, input_string):
+                return super().correct_input(input_string).upper()
+
+        class CustomRecordType(RecordType):
+            field_definition_dict = make_94_character_field_definition_dict(
+                UpperFieldDefinition
+            )
+
+        self.assertEqual(
+            CustomRecordType.from_line("7" + "x" * 93).render_record_line(),
+            "7" + "X" * 93,
+        )
+
+    def test_record_type_subclass_not_desired_size_on_class_creation(self):
+        field_definition_dict = {
+            "record_code": FieldDefinition(
+                "record_code", IntegerFieldType, length=1, required=False
+            ),
+        }
+        with self.assertRaises(InvalidRecordSizeError):
+            type(
+                "CustomRecordType",
+                (RecordType,),
+                {"field_definition_dict": field_definition_dict},
+            )
+
+        custom_record_type_class = type(
+            "CustomRecordType",
+            (RecordType,),
+            {"field_definition_dict": field_definition_dict, "desired_record_size": 1},
+        )
+        self.assertEqual(custom_record_type_class().render_record_line(), "0")
+
 
 class TestFileHeaderRecordType(TestCase):
     def test_file_header(self):
@@ -139,6 +218,51 @@ class TestFileHeaderRecordType(TestCase):
             "101 012345678 123456789221106    A094101The Big Fed            The Little Fintech             ",
         )
 
+    def test_file_header_tweak_default_after_first_record(self):
+        field_def = FileHeaderRecordType.field_definition_dict["file_id_modifier"]
+        args = ("012345678", 123456789, "The Big Fed", "The Little Fintech")
+        self.assertEqual(
+            FileHeaderRecordType(*args).get_field_value("file_id_modifier"), "A"
+        )
+        field_def.default = "B"
+        try:
+            self.assertEqual(
+                FileHeaderRecordType(*args).get_field_value("file_id_modifier"), "B"
+            )
+        finally:
+            field_def.default = "A"
+
+    def test_file_header_required_kwargs(self):
+        required_kwargs = FileHeaderRecordType.get_required_kwargs()
+        self.assertEqual(
+            list(required_kwargs),
+            [
+                "destination_routing",
+                "origin_routing",
+                "destination_name",
+                "origin_name",
+            ],
+        )
+        self.assertEqual(
+            FileHeaderRecordType.field_names(only_required=True), tuple(required_kwargs)
+        )
+        self.assertEqual(
+            FileHeaderRecordType.field_names(),
+            tuple(FileHeaderRecordType.field_definition_dict),
+        )
+        required_kwargs.pop("origin_name")
+        self.assertIn("origin_name", FileHeaderRecordType.get_required_kwargs())
+
+        field_def = FileHeaderRecordType.field_definition_dict["origin_name"]
+        field_def.default = "The Little Fintech"
+        try:
+            self.assertNotIn("origin_name", FileHeaderRecordType.get_required_kwargs())
+            self.assertNotIn(
+                "origin_name", FileHeaderRecordType.field_names(only_required=True)
+            )
+        finally:
+            field_def.default = None
+
 
 class TestBatchHeaderRecordType(TestCase):
     def test_batch_header(self):
@@ -167,8 +291,96 @@ class TestEntryDetailRecordType(TestCase):
         self.assertEqual(len(record_line), 94)
         self.assertEqual(
             record_line,
-            "622123456789123456           0000000100               Testy Testface          1012345670000001",
+            ENTRY_DETAIL_LINE,
+        )
+
+    def test_entry_detail_from_line(self):
+        line = ENTRY_DETAIL_LINE
+        entry_detail = EntryDetailRecordType.from_line(line)
+        self.assertEqual(entry_detail.get_field_value("amount"), "0000000100")
+        self.assertEqual(entry_detail.render_record_line(), line)
+
+    def test_entry_detail_from_line_matches_field_by_field_parsing(self):
+        line = ENTRY_DETAIL_LINE
+        entry_detail = EntryDetailRecordType.from_line(line)
+        field_slices = EntryDetailRecordType._get_field_slices()
+        expected = EntryDetailRecordType(**{key: line[x] for key, x in field_slices})
+        self.assertEqual(entry_detail.get_field_values(), expected.get_field_values())
+        for key, field in entry_detail.fields.items():
+            self.assertIs(type(field.value), str)
+            self.assertEqual(field.original_value, expected.fields[key].original_value)
+
+        with self.assertRaises(RecordTypeAggregateFieldCreationError) as ctx:
+            EntryDetailRecordType.from_line(line.replace("0000000100", "00000001x0"))
+        self.assertEqual(ctx.exception.failed_keys, ["amount"])
+
+    def test_entry_detail_read_line_field_values(self):
+        line = ENTRY_DETAIL_LINE
+        self.assertEqual(
+            EntryDetailRecordType.read_line_field_values(
+                line, "amount", "rdfi_routing"
+            ),
+            {"amount": "0000000100", "rdfi_routing": "123456789"},
+        )
+        self.assertEqual(
+            EntryDetailRecordType.read_line_field_values(line),
+            EntryDetailRecordType.from_line(line).get_field_values(),
+        )
+        with self.assertRaises(InvalidRecordTypeParametersError):
+            EntryDetailRecordType.read_line_field_values(line, "not_a_field")
+
+    def test_entry_detail_field_values_follow_field_changes(self):
+        entry_detail = EntryDetailRecordType(
+            22, "123456789", "123456", "100", "Testy Testface", "012345670000001"
+        )
+        field_values = entry_detail.get_field_values()
+        self.assertEqual(field_values["amount"], "0000000100")
+        field_values["amount"] = "changed"
+        self.assertEqual(entry_detail.get_field_values()["amount"], "0000000100")
+
+        entry_detail.set_field_value("amount", 200)
+        self.assertEqual(entry_detail.get_field_values()["amount"], "0000000200")
+        entry_detail.fields["amount"].cleaned_value = "0000000300"
+        self.assertEqual(entry_detail.get_field_values()["amount"], "0000000300")
+        entry_detail.fields["amount"] = Field(
+            EntryDetailRecordType.field_definition_dict["amount"], 400
+        )
+        self.assertEqual(entry_detail.get_field_values()["amount"], "0000000400")
+
+    def test_entry_detail_render_line_follows_field_changes(self):
+        line = ENTRY_DETAIL_LINE
+        entry_detail = EntryDetailRecordType.from_line(line)
+        self.assertEqual(entry_detail.render_record_line(), line)
+
+        entry_detail.set_field_value("amount", 200)
+        self.assertEqual(
+            entry_detail.render_record_line(), line.replace("0000000100", "0000000200")
+        )
+        entry_detail.fields["amount"].cleaned_value = "0000000300"
+        self.assertEqual(
+            entry_detail.render_record_line(), line.replace("0000000100", "0000000300")
+        )
+        entry_detail.fields["amount"] = Field(
+            EntryDetailRecordType.field_definition_dict["amount"], 400
+        )
+        self.assertEqual(
+            entry_detail.render_record_line(), line.replace("0000000100", "0000000400")
+        )
+
+    def test_entry_detail_missing_required_values(self):
+        with self.assertRaises(RecordTypeAggregateFieldCreationError) as ctx:
+            EntryDetailRecordType(22, "123456789", "123456", None, None)
+        self.assertEqual(
+            ctx.exception.failed_keys,
+            [
+                "amount",
+                "individual_name",
+                "trace_odfi_identifier",
+                "trace_sequence_number",
+            ],
         )
+        for exc in ctx.exception.errors:
+            self.assertIsInstance(exc, EmptyRequiredFieldError)
 
     def test_entry_detail_two_part_trace_number(self):
         entry_detail = EntryDetailRecordType(
@@ -184,7 +396,7 @@ class TestEntryDetailRecordType(TestCase):
         self.assertEqual(len(record_line), 94)
         self.assertEqual(
             record_line,
-            "622123456789123456           0000000100               Testy Testface          1012345670000001",
+            ENTRY_DETAIL_LINE,
         )
 
 